@@ -1,17 +1,28 @@
 import os
+import contextlib
+import functools
+import gzip
+import http.client
 import json
+import mmap
 import zipfile
 import urllib.request
 import urllib.error
 import ssl
 import shutil
+import stat
 import tempfile
 import sys
 import subprocess
+import threading
+import time
+import types
+from concurrent.futures import FIRST_EXCEPTION, ThreadPoolExecutor, wait
 from pathlib import Path
 
 # Platform-specific imports for keypress detection
 if sys.platform == 'win32':
+    import ctypes
     import msvcrt
 else:
     import tty
@@ -43,39 +54,159 @@ class Colors:
     BG_WHITE = '\033[47m'
 
 
+# Pre-built pieces of the download progress bar
+_BAR_LENGTH = 50
+_BAR_FULL = '█' * _BAR_LENGTH
+_BAR_EMPTY = '░' * _BAR_LENGTH
+_BAR_PREFIX = f'\r{Colors.GREEN}['
+_BAR_SUFFIX = f']{Colors.RESET} '
+
+
 INSTALLER_VERSION = "1.0.0"
 
+# Downloaded archives larger than this spill from memory to a temporary file
+SPOOL_MAX_SIZE = 64 * 1024 * 1024
+
+# Files at least this large are downloaded over several ranged connections
+PARALLEL_DOWNLOAD_MIN_SIZE = 4 * 1024 * 1024
+DOWNLOAD_CONNECTIONS = 8
+DOWNLOAD_BLOCK_SIZE = 1024 * 1024
+
+# Upper bound on threads extracting archive members
+EXTRACT_WORKERS = 8
+
+# Name prefix for replaced entries set aside inside the install folder until extraction succeeds
+_TRASH_PREFIX = '.image-tea-old-'
+
+# Extracted files at least this large get a DONTNEED page-cache hint after writing
+FADVISE_MIN_SIZE = 16 * 1024 * 1024
+
+# Minimum seconds between progress bar redraws
+PROGRESS_INTERVAL = 0.05
+
+# Last GitHub release response and its ETag, stored next to the installer
+RELEASE_CACHE_FILE = ".release_cache.json"
+
+# Directory of this script (the PyInstaller temp dir when frozen), resolved once at import
+_SCRIPT_DIR = Path(__file__).resolve().parent
+
+# SSL context that doesn't verify certificates (for environments with SSL issues),
+# built once and shared by every request through a single opener
+_SSL_CONTEXT = ssl.create_default_context()
+_SSL_CONTEXT.check_hostname = False
+_SSL_CONTEXT.verify_mode = ssl.CERT_NONE
+_OPENER = urllib.request.build_opener(urllib.request.HTTPSHandler(context=_SSL_CONTEXT))
+_OPENER.addheaders = [('User-Agent', f'image-tea-installer/{INSTALLER_VERSION}')]
+
+# Network timeout (seconds) and retry policy for transient HTTP failures
+HTTP_TIMEOUT = 30
+HTTP_RETRIES = 3
+HTTP_RETRY_BACKOFF = 0.3
+
+# Errors that can cut a response body off mid-stream; downloads resume after them
+# (errors while connecting are retried by _open_url instead)
+_STREAM_ERRORS = (http.client.IncompleteRead, ConnectionError, TimeoutError)
+
+
+_ansi_enabled = False
+
+
+def enable_ansi_colors():
+    """Turn on ANSI escape processing for the Windows console (no-op elsewhere)"""
+    global _ansi_enabled
+    if _ansi_enabled or sys.platform != 'win32':
+        return
+    kernel32 = ctypes.windll.kernel32
+    handle = kernel32.GetStdHandle(-11)  # STD_OUTPUT_HANDLE
+    mode = ctypes.c_uint32()
+    if kernel32.GetConsoleMode(handle, ctypes.byref(mode)):
+        kernel32.SetConsoleMode(handle, mode.value | 0x0004)  # ENABLE_VIRTUAL_TERMINAL_PROCESSING
+    _ansi_enabled = True
+
+
+_stdin_raw = False
+
+
+@contextlib.contextmanager
+def _raw_stdin():
+    """Keep the POSIX terminal in single-keypress mode for a whole prompt loop, so the
+    terminal attributes are saved and restored once rather than on every getch().
+    Output processing stays enabled so frames printed inside the loop render normally."""
+    global _stdin_raw
+    if sys.platform == 'win32' or _stdin_raw:
+        yield
+        return
+    fd = sys.stdin.fileno()
+    old_settings = termios.tcgetattr(fd)
+    try:
+        tty.setcbreak(fd)
+        _stdin_raw = True
+        yield
+    finally:
+        _stdin_raw = False
+        termios.tcsetattr(fd, termios.TCSADRAIN, old_settings)
+
 
 def getch():
     """Get single character input without Enter"""
     if sys.platform == 'win32':
         return msvcrt.getch().decode('utf-8', errors='ignore').lower()
-    else:
-        fd = sys.stdin.fileno()
-        old_settings = termios.tcgetattr(fd)
-        try:
-            tty.setraw(fd)
-            ch = sys.stdin.read(1).lower()
-        finally:
-            termios.tcsetattr(fd, termios.TCSADRAIN, old_settings)
-        return ch
+    # A no-op inside a prompt loop that already holds the terminal in cbreak mode
+    with _raw_stdin():
+        return sys.stdin.read(1).lower()
+
+
+# Y/N confirmation prompts; the green answer is the one Enter selects
+_PROMPT_PROCEED = f"{Colors.BOLD}Proceed with setup? [{Colors.GREEN}Y{Colors.RESET}/{Colors.RED}N{Colors.RESET}]: {Colors.RESET}"
+_PROMPT_RUN_NOW = f"{Colors.BOLD}Run Image Tea now? [{Colors.GREEN}Y{Colors.RESET}/{Colors.RED}N{Colors.RESET}]: {Colors.RESET}"
+_PROMPT_UNINSTALL = f"{Colors.BOLD}Are you sure you want to uninstall? [{Colors.RED}Y{Colors.RESET}/{Colors.GREEN}N{Colors.RESET}]: {Colors.RESET}"
+_PROMPT_UNINSTALL_FINAL = f"{Colors.BOLD}Final confirmation - Delete Image Tea folder? [{Colors.RED}Y{Colors.RESET}/{Colors.GREEN}N{Colors.RESET}]: {Colors.RESET}"
+
+
+def _confirm(prompt, default_yes=True):
+    """Show a Y/N prompt and wait for Y or N (Enter picks the default); returns True for yes"""
+    with _raw_stdin():
+        while True:
+            sys.stdout.write(prompt)
+            sys.stdout.flush()
+            key = getch()
+            # Enter arrives as '\n' in cbreak mode; end the prompt line without echoing it
+            print('' if key in ('\r', '\n') else key)
+            if key in ('\r', '\n', ''):
+                return default_yes
+            if key in ('y', 'n'):
+                return key == 'y'
+            # ignore other keys and loop again
+
+
+# Header box pieces; the width is fixed so the borders are built once
+_HEADER_WIDTH = 70
+_HEADER_STYLE = Colors.CYAN + Colors.BOLD
+_HEADER_TOP = f"{_HEADER_STYLE}╔{'═' * (_HEADER_WIDTH - 2)}╗{Colors.RESET}\n"
+_HEADER_BOTTOM = f"{_HEADER_STYLE}╚{'═' * (_HEADER_WIDTH - 2)}╝{Colors.RESET}\n"
 
 
 def print_header(text):
     """Print styled header box"""
-    width = 70
-    top = '╔' + '═' * (width - 2) + '╗'
-    middle = '║' + ' ' * ((width - len(text) - 2) // 2) + text + ' ' * ((width - len(text) - 1) // 2) + '║'
-    bottom = '╚' + '═' * (width - 2) + '╝'
-    print(f"\n{Colors.CYAN}{Colors.BOLD}{top}{Colors.RESET}")
-    print(f"{Colors.CYAN}{Colors.BOLD}{middle}{Colors.RESET}")
-    print(f"{Colors.CYAN}{Colors.BOLD}{bottom}{Colors.RESET}")
+    middle = f"{_HEADER_STYLE}║{text.center(_HEADER_WIDTH - 2)}║{Colors.RESET}\n"
+    sys.stdout.write('\n' + _HEADER_TOP + middle + _HEADER_BOTTOM)
+
+
+# Maximum inner content width of frames (total width - 4 for borders and padding)
+# and the precomputed split used when truncating lines to it. Lines are always
+# truncated to this, so every frame has the same width.
+_FRAME_MAX_INNER = 66
+_FRAME_WIDTH = _FRAME_MAX_INNER + 4
+_TRUNC_LEFT = (_FRAME_MAX_INNER - 3) // 2
+_TRUNC_RIGHT = _FRAME_MAX_INNER - 3 - _TRUNC_LEFT
 
 
 def truncate_middle(s: str, maxlen: int) -> str:
     """Truncate string in the middle with '...' so total length <= maxlen."""
     if len(s) <= maxlen:
         return s
+    if maxlen == _FRAME_MAX_INNER:
+        return s[:_TRUNC_LEFT] + '...' + s[-_TRUNC_RIGHT:]
     if maxlen <= 3:
         return s[:maxlen]
     # split remaining length evenly
@@ -85,6 +216,20 @@ def truncate_middle(s: str, maxlen: int) -> str:
     return s[:left] + '...' + s[-right:]
 
 
+@functools.lru_cache(maxsize=32)
+def _frame_parts(color, style):
+    """Colored (top, bottom, row prefix, row suffix) strings for a frame; the installer
+    only uses a handful of color/style combinations, so these are built once each"""
+    # Choose border characters
+    if style == 'double':
+        tl, tr, bl, br, h, v = '╔', '╗', '╚', '╝', '═', '║'
+    else:
+        tl, tr, bl, br, h, v = '┌', '┐', '└', '┘', '─', '│'
+    top = f"{color}{tl}{h * (_FRAME_WIDTH - 2)}{tr}{Colors.RESET}\n"
+    bottom = f"{color}{bl}{h * (_FRAME_WIDTH - 2)}{br}{Colors.RESET}\n"
+    return top, bottom, f"{color}{v} ", f"{v}{Colors.RESET}\n"
+
+
 def print_frame(title, content_lines, color=Colors.CYAN, style='double'):
     """
     Generic frame printer
@@ -96,84 +241,111 @@ def print_frame(title, content_lines, color=Colors.CYAN, style='double'):
     if not content_lines:
         return
 
-    # Choose border characters
-    if style == 'double':
-        tl, tr, bl, br, h, v = '╔', '╗', '╚', '╝', '═', '║'
-    else:
-        tl, tr, bl, br, h, v = '┌', '┐', '└', '┘', '─', '│'
-
-    # Maximum inner content width (inner chars excluding borders)
-    MAX_INNER = 66  # total width - 4 for borders and padding
-
     # Truncate long lines to keep frames compact
     processed = []
     for line in ([title] if title else []) + content_lines:
-        processed.append(truncate_middle(line, MAX_INNER))
-
-    all_lines = processed
-    max_len = max(len(line) for line in all_lines)
-    width = max(70, max_len + 4)
-
-    # Build frame
-    top = tl + h * (width - 2) + tr
-    lines_output = []
-
-    if title:
-        tline = processed[0]
-        pad = width - len(tline) - 3
-        lines_output.append(v + ' ' + tline + ' ' * pad + v)
-        content_start = 1
-    else:
-        content_start = 0
+        processed.append(truncate_middle(line, _FRAME_MAX_INNER))
 
-    for line in processed[content_start:]:
-        pad = width - len(line) - 3
-        lines_output.append(v + ' ' + line + ' ' * pad + v)
+    # Each row: border, one space, the line left-aligned in the remaining width, border
+    top, bottom, prefix, suffix = _frame_parts(color, style)
+    rows = ''.join(f"{prefix}{line:<{_FRAME_WIDTH - 3}}{suffix}" for line in processed)
 
-    bottom = bl + h * (width - 2) + br
-
-    # Print frame
-    print(f"{color}{top}{Colors.RESET}")
-    for line in lines_output:
-        print(f"{color}{line}{Colors.RESET}")
-    print(f"{color}{bottom}{Colors.RESET}")
+    # Print frame with a single write
+    sys.stdout.write(top + rows + bottom)
 
 
+@functools.lru_cache(maxsize=1)
 def load_config():
     """Load configuration from installer_configs.json
 
     When packaged with PyInstaller using --onefile, data files are extracted
     to a temporary folder accessible via sys._MEIPASS. Use that path when
     available so the bundled config can be found at runtime.
+
+    The file is parsed once per process; callers share a read-only mapping.
     """
     base = getattr(sys, '_MEIPASS', None)
     if base:
         config_path = Path(base) / "installer_configs.json"
     else:
-        config_path = Path(__file__).parent / "installer_configs.json"
+        config_path = _SCRIPT_DIR / "installer_configs.json"
 
     with open(config_path, 'r', encoding='utf-8') as f:
-        return json.load(f)
+        return types.MappingProxyType(json.load(f))
+
+
+def _open_url(request):
+    """Open a URL or Request through the shared opener, retrying transient failures
+    (connection errors, timeouts, HTTP 429/5xx) with exponential backoff"""
+    for attempt in range(HTTP_RETRIES + 1):
+        try:
+            return _OPENER.open(request, timeout=HTTP_TIMEOUT)
+        except urllib.error.HTTPError as e:
+            if (e.code != 429 and e.code < 500) or attempt == HTTP_RETRIES:
+                raise
+            # Release the error response's connection before retrying
+            e.close()
+        except (urllib.error.URLError, ConnectionError, TimeoutError):
+            if attempt == HTTP_RETRIES:
+                raise
+        time.sleep(HTTP_RETRY_BACKOFF * 2 ** attempt)
+
+
+def _load_release_cache(cache_path, api_url):
+    """Return the cached {'url', 'etag', 'body'} entry for api_url, or None"""
+    try:
+        with open(cache_path, 'r', encoding='utf-8') as f:
+            cache = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if not isinstance(cache, dict) or cache.get('url') != api_url or not cache.get('etag'):
+        return None
+    return cache
+
+
+def _save_release_cache(cache_path, api_url, etag, release):
+    """Atomically store the release response with its ETag (best effort)"""
+    tmp_path = cache_path.with_name(cache_path.name + '.tmp')
+    try:
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump({'url': api_url, 'etag': etag, 'body': release}, f)
+        os.replace(tmp_path, cache_path)
+    except OSError:
+        pass
+
 
+def get_latest_release(repo_url, cache_path=None):
+    """Get latest release information from GitHub repository
 
-def get_latest_release(repo_url):
-    """Get latest release information from GitHub repository"""
+    When cache_path is given, the response is kept there with its ETag and
+    revalidated with If-None-Match on later runs, so an unchanged release
+    costs a bodiless 304 reply."""
     # Extract owner and repo name from URL
     # Example: https://github.com/mudrikam/Image-Tea-nano -> mudrikam/Image-Tea-nano
     parts = repo_url.rstrip('/').split('/')
     owner, repo = parts[-2], parts[-1]
     
     api_url = f"https://api.github.com/repos/{owner}/{repo}/releases/latest"
+    cache = _load_release_cache(cache_path, api_url) if cache_path else None
     
     try:
-        # Create SSL context that doesn't verify certificates (for environments with SSL issues)
-        ssl_context = ssl.create_default_context()
-        ssl_context.check_hostname = False
-        ssl_context.verify_mode = ssl.CERT_NONE
-        
-        with urllib.request.urlopen(api_url, context=ssl_context) as response:
-            return json.loads(response.read().decode())
+        # Release metadata is highly compressible JSON; let GitHub send it gzipped
+        headers = {'Accept': 'application/vnd.github+json', 'Accept-Encoding': 'gzip'}
+        if cache:
+            headers['If-None-Match'] = cache['etag']
+        request = urllib.request.Request(api_url, headers=headers)
+        with _open_url(request) as response:
+            body = response.read()
+            if response.headers.get('Content-Encoding') == 'gzip':
+                body = gzip.decompress(body)
+            etag = response.headers.get('ETag')
+        release = json.loads(body)
+        if cache_path and etag:
+            _save_release_cache(cache_path, api_url, etag, release)
+        return release
     except urllib.error.HTTPError as e:
+        if e.code == 304 and cache:
+            return cache['body']
         print(f"Error fetching latest release: {e}")
         raise
     except Exception as e:
@@ -181,42 +353,187 @@ def get_latest_release(repo_url):
         raise
 
 
+def _probe_download(url):
+    """Resolve redirects and size the download with a one-byte range request.
+
+    A 206 reply's Content-Range ("bytes 0-0/<total>") gives the final URL, the size and
+    proof that ranges are honoured in one round trip; servers that ignore Range answer 200
+    and get a single-stream download. (urllib turns a redirected HEAD into a full GET
+    before Python 3.13, so HEAD would start fetching the whole asset.)
+    Returns (final_url, total_size, supports_ranges); size 0 when unknown."""
+    try:
+        request = urllib.request.Request(url, headers={'Range': 'bytes=0-0'})
+        with _open_url(request) as response:
+            final_url = response.geturl()
+            if response.status == 206:
+                total = response.headers.get('Content-Range', '').rpartition('/')[2]
+                if total.isdigit():
+                    return final_url, int(total), True
+            return final_url, int(response.headers.get('Content-Length', 0)), False
+    except urllib.error.HTTPError:
+        # e.g. 416 for an empty file; fall back to a plain single-stream GET
+        return url, 0, False
+
+
+def _preallocate(file, size):
+    """Resize file to size bytes; when the download is large enough to live on disk, also
+    reserve its extents up front so the filesystem can lay it out contiguously"""
+    file.truncate(size)
+    # The download spool stays in memory up to SPOOL_MAX_SIZE and truncate() rolls it over to
+    # disk beyond that; below it there is nothing to reserve, and fileno() would force a rollover
+    if size > SPOOL_MAX_SIZE and hasattr(os, 'posix_fallocate'):
+        with contextlib.suppress(OSError, ValueError):
+            os.posix_fallocate(file.fileno(), 0, size)
+
+
+def _download_range(url, start, end, destination, lock, downloaded, stop):
+    """Fetch bytes start..end (inclusive) of url and write them at the same offset in destination,
+    resuming from the last written byte if the connection drops. Gives up quietly once stop is set."""
+    view = memoryview(bytearray(DOWNLOAD_BLOCK_SIZE))
+    offset = start
+    for attempt in range(HTTP_RETRIES + 1):
+        # Failures to connect are already retried by _open_url; only a body cut off
+        # mid-stream is resumed here
+        request = urllib.request.Request(url, headers={'Range': f'bytes={offset}-{end}'})
+        with _open_url(request) as response:
+            if response.status != 206:
+                raise urllib.error.URLError(f"server ignored range request (HTTP {response.status})")
+            try:
+                while True:
+                    if stop.is_set():
+                        return
+                    count = response.readinto(view)
+                    if not count:
+                        break
+                    with lock:
+                        destination.seek(offset)
+                        destination.write(view[:count])
+                        downloaded[0] += count
+                    offset += count
+                if offset <= end:
+                    # readinto() reports a body cut short as a plain end of stream
+                    raise http.client.IncompleteRead(b'', end + 1 - offset)
+                return
+            except _STREAM_ERRORS:
+                if attempt == HTTP_RETRIES:
+                    raise
+        time.sleep(HTTP_RETRY_BACKOFF * 2 ** attempt)
+
+
+def _download_stream(url, destination, progress_hook):
+    """Stream url into destination over a single connection.
+
+    A dropped connection is resumed with a Range request for the missing tail;
+    servers that answer with the full body instead restart the download."""
+    # Read into one reusable buffer rather than allocating a bytes object per block
+    view = memoryview(bytearray(DOWNLOAD_BLOCK_SIZE))
+    downloaded = total_size = 0
+    for attempt in range(HTTP_RETRIES + 1):
+        # Failures to connect are already retried by _open_url; only a body cut off
+        # mid-stream is resumed here
+        headers = {'Range': f'bytes={downloaded}-'} if downloaded else {}
+        with _open_url(urllib.request.Request(url, headers=headers)) as response:
+            length = int(response.headers.get('Content-Length', 0))
+            if response.status != 206:
+                destination.seek(0)
+                _preallocate(destination, length)
+                downloaded = 0
+                total_size = length
+            expected = downloaded + length
+            try:
+                while True:
+                    count = response.readinto(view)
+                    if not count:
+                        break
+                    destination.write(view[:count])
+                    downloaded += count
+                    progress_hook(downloaded, total_size)
+                if downloaded < expected:
+                    # readinto() reports a body cut short as a plain end of stream
+                    raise http.client.IncompleteRead(b'', expected - downloaded)
+                return
+            except _STREAM_ERRORS:
+                if attempt == HTTP_RETRIES:
+                    raise
+        time.sleep(HTTP_RETRY_BACKOFF * 2 ** attempt)
+
+
 def download_file(url, destination):
-    """Download file from URL to destination with progress indicator"""
+    """Download file from URL into a writable, seekable binary file object with progress indicator.
+
+    When the server supports byte ranges, large files are fetched over several
+    concurrent connections and reassembled in place."""
     lines = [
         f"URL:         {url}",
-        f"Destination: {destination}",
         ""
     ]
     print_frame("DOWNLOADING", lines, Colors.YELLOW, 'single')
     
     try:
-        # Create SSL context that doesn't verify certificates
-        ssl_context = ssl.create_default_context()
-        ssl_context.check_hostname = False
-        ssl_context.verify_mode = ssl.CERT_NONE
-        
-        def progress_hook(block_num, block_size, total_size):
-            if total_size > 0:
-                downloaded = block_num * block_size
-                percent = min(int(downloaded / total_size * 100), 100)
-                bar_length = 50
-                filled = int(bar_length * percent / 100)
-                bar = '█' * filled + '░' * (bar_length - filled)
+        # The bar only has _BAR_LENGTH + 1 possible states: build (and encode) them once per
+        # download and write redraws straight to the byte stream, bypassing the text layer's
+        # encoder; plain text writes are used when stdout has no underlying buffer
+        stdout_bytes = getattr(sys.stdout, 'buffer', None)
+        bars = [_BAR_PREFIX + _BAR_FULL[:n] + _BAR_EMPTY[n:] + _BAR_SUFFIX for n in range(_BAR_LENGTH + 1)]
+        if stdout_bytes is not None:
+            encoding = sys.stdout.encoding or 'utf-8'
+            bars = [bar.encode(encoding, 'replace') for bar in bars]
+            sys.stdout.flush()
+
+        # Time and percentage of the last redraw (time is None once completion is shown)
+        last_draw = [0.0, -1]
+
+        def progress_hook(downloaded, total_size):
+            if total_size > 0 and last_draw[0] is not None:
+                # Redraw only when the percentage changed, at most once every
+                # PROGRESS_INTERVAL seconds, but always (and only once) draw the completed bar
+                complete = downloaded >= total_size
+                percent = min(downloaded * 100 // total_size, 100)
+                now = time.monotonic()
+                if not complete and (percent == last_draw[1] or now - last_draw[0] < PROGRESS_INTERVAL):
+                    return
+                last_draw[:] = [None if complete else now, percent]
+
+                filled = _BAR_LENGTH * percent // 100
                 mb_downloaded = downloaded / (1024 * 1024)
                 mb_total = total_size / (1024 * 1024)
+                stats = f'{percent}% ({mb_downloaded:.1f}/{mb_total:.1f} MB)' + ('\n' if complete else '')
                 
-                sys.stdout.write(f'\r{Colors.GREEN}[{bar}]{Colors.RESET} {percent}% ({mb_downloaded:.1f}/{mb_total:.1f} MB)')
-                sys.stdout.flush()
-                
-                if downloaded >= total_size:
-                    print()
-        
-        # Create opener with SSL context
-        opener = urllib.request.build_opener(urllib.request.HTTPSHandler(context=ssl_context))
-        urllib.request.install_opener(opener)
+                if stdout_bytes is None:
+                    sys.stdout.write(bars[filled] + stats)
+                    sys.stdout.flush()
+                else:
+                    stdout_bytes.write(bars[filled] + stats.encode('ascii'))
+                    stdout_bytes.flush()
         
-        urllib.request.urlretrieve(url, destination, progress_hook)
+        url, total_size, supports_ranges = _probe_download(url)
+        if supports_ranges and total_size >= PARALLEL_DOWNLOAD_MIN_SIZE:
+            # Split into one range per connection; workers write their range at its offset
+            # while this thread redraws the progress bar from the shared byte counter
+            lock = threading.Lock()
+            downloaded = [0]
+            _preallocate(destination, total_size)
+            step = -(-total_size // DOWNLOAD_CONNECTIONS)
+            stop = threading.Event()
+            with ThreadPoolExecutor(max_workers=DOWNLOAD_CONNECTIONS) as executor:
+                pending = [
+                    executor.submit(_download_range, url, start,
+                                    min(start + step, total_size) - 1, destination, lock, downloaded, stop)
+                    for start in range(0, total_size, step)
+                ]
+                try:
+                    while pending:
+                        finished, pending = wait(pending, timeout=PROGRESS_INTERVAL, return_when=FIRST_EXCEPTION)
+                        for future in finished:
+                            future.result()
+                        progress_hook(downloaded[0], total_size)
+                except BaseException:
+                    # A failed range or Ctrl+C: stop the other connections at their next block
+                    # instead of letting the executor wait for the whole download
+                    stop.set()
+                    raise
+        else:
+            _download_stream(url, destination, progress_hook)
         # Show completion inside a small frame
         print_frame("DOWNLOAD", ["[+] Download completed!"], Colors.GREEN, 'single')
         return True
@@ -225,11 +542,117 @@ def download_file(url, destination):
         return False
 
 
-def extract_zip(zip_path, extract_to):
-    """Extract zip file to specified directory, placing contents directly into extract_to
-    (if the zip contains a single top-level directory, its children are moved up)."""
+def _is_link(st):
+    """True for a symlink, or on Windows any reparse point such as a junction"""
+    if stat.S_ISLNK(st.st_mode):
+        return True
+    return sys.platform == 'win32' and bool(st.st_file_attributes & stat.FILE_ATTRIBUTE_REPARSE_POINT)
+
+
+def _fast_rmtree(path):
+    """Delete a directory tree the installer just wrote, using an explicit os.scandir stack
+    instead of recursion. Symlinks and Windows junctions inside it are removed as links, never
+    followed; like shutil.rmtree, a link passed as path itself is refused."""
+    if _is_link(os.lstat(path)):
+        raise OSError(f"Cannot remove a symbolic link as a directory tree: {path}")
+    stack = [path]
+    directories = []
+    while stack:
+        current = stack.pop()
+        directories.append(current)
+        with os.scandir(current) as entries:
+            for entry in entries:
+                # Only Windows needs the extra lstat: elsewhere is_dir(follow_symlinks=False)
+                # already excludes links
+                if entry.is_dir(follow_symlinks=False) and not (
+                        sys.platform == 'win32' and _is_link(entry.stat(follow_symlinks=False))):
+                    stack.append(entry.path)
+                else:
+                    os.unlink(entry.path)
+    # Children were discovered after their parents, so remove in reverse order
+    for directory in reversed(directories):
+        os.rmdir(directory)
+
+
+def _remove_entry(path):
+    """Delete a file, link or directory tree written or set aside by the installer"""
+    if _is_link(os.lstat(path)) or not os.path.isdir(path):
+        os.unlink(path)
+    else:
+        _fast_rmtree(path)
+
+
+def _remove_trash(paths):
+    """Delete entries renamed aside by extract_zip (runs in a background thread)"""
+    for path in paths:
+        with contextlib.suppress(OSError):
+            _remove_entry(path)
+
+
+def _restore_replaced(extract_to, names, replaced):
+    """Undo a failed extraction: delete the top-level entries it wrote, then move the
+    entries extract_zip renamed aside back to their original paths"""
+    # Best effort: the extraction error is the one worth reporting
+    for name in names:
+        with contextlib.suppress(OSError):
+            _remove_entry(os.path.join(extract_to, name))
+    for original, aside in replaced:
+        with contextlib.suppress(OSError):
+            os.replace(aside, original)
+
+
+# Characters ZipFile.extract replaces in member names on Windows; a ':' would otherwise
+# write into an NTFS alternate data stream
+_WINDOWS_ILLEGAL_NAME_CHARS = str.maketrans(':<>|"?*', '_' * 7)
+
+
+def _member_path(extract_to, filename):
+    """Map an archive member name to a path inside extract_to, dropping unsafe components;
+    on Windows names are also sanitized the way ZipFile.extract does"""
+    filename = os.path.splitdrive(filename)[1].replace('\\', '/')
+    parts = [part for part in filename.split('/') if part not in ('', '.', '..')]
+    if sys.platform == 'win32':
+        # Replace illegal characters and strip trailing dots and spaces, dropping parts left empty
+        parts = [part.translate(_WINDOWS_ILLEGAL_NAME_CHARS).rstrip(' .') for part in parts]
+        parts = [part for part in parts if part]
+    return extract_to.joinpath(*parts)
+
+
+def _fast_extract(zip_ref, info, extract_to):
+    """Extract a single file member, copying with a buffer sized to the file instead of
+    going through ZipFile.extract. Its parent directory must already exist."""
+    target = _member_path(extract_to, info.filename)
+    if info.file_size == 0:
+        open(target, 'wb').close()
+    else:
+        with zip_ref.open(info) as src, open(target, 'wb') as dst:
+            shutil.copyfileobj(src, dst, min(info.file_size, 1024 * 1024))
+            if info.file_size >= FADVISE_MIN_SIZE and hasattr(os, 'posix_fadvise'):
+                # Large files won't be read back by the installer. Dirty pages are not dropped by
+                # DONTNEED, so this mainly starts their writeback now (and drops any already clean),
+                # letting the kernel reclaim them sooner; fdatasync first would stall on the disk
+                dst.flush()
+                with contextlib.suppress(OSError):
+                    os.posix_fadvise(dst.fileno(), 0, 0, os.POSIX_FADV_DONTNEED)
+
+    # Keep unix permission bits (e.g. executable launchers) recorded in the archive
+    mode = (info.external_attr >> 16) & 0o777
+    if mode and sys.platform != 'win32':
+        os.chmod(target, mode)
+
+
+def _extract_shard(zip_ref, infos, extract_to, stop):
+    """Extract a group of archive members (runs in a worker thread), stopping early once stop is set"""
+    for info in infos:
+        if stop.is_set():
+            return
+        _fast_extract(zip_ref, info, extract_to)
+
+
+def extract_zip(zip_file, extract_to):
+    """Extract zip archive (path or binary file object) directly into extract_to
+    (if the zip contains a single top-level directory, its children are placed in extract_to)."""
     lines = [
-        f"Archive: {zip_path}",
         f"Target:  {extract_to}",
         ""
     ]
@@ -239,39 +662,101 @@ def extract_zip(zip_path, extract_to):
         # Ensure target directory exists
         extract_to.mkdir(parents=True, exist_ok=True)
 
-        with tempfile.TemporaryDirectory(dir=extract_to.parent) as tmpdir:
-            tmp_path = Path(tmpdir)
-            
+        with zipfile.ZipFile(zip_file, 'r') as zip_ref:
+            infos = zip_ref.infolist()
+            # If the archive contains a single top-level directory, strip it from member
+            # names so its children are written straight into the target directory
+            roots = {info.filename.split('/', 1)[0] for info in infos}
+            if len(roots) == 1 and all('/' in info.filename for info in infos):
+                prefix_len = len(roots.pop()) + 1
+                infos = [info for info in infos if info.filename[prefix_len:]]
+                for info in infos:
+                    info.filename = info.filename[prefix_len:]
 
-            with zipfile.ZipFile(zip_path, 'r') as zip_ref:
-                zip_ref.extractall(tmp_path)
-            entries = list(tmp_path.iterdir())
-            # If the archive contains a single top-level directory, move its children up
-            if len(entries) == 1 and entries[0].is_dir():
-                source = entries[0]
-                for item in source.iterdir():
-                    dest = extract_to / item.name
-                    if dest.exists():
-                        if dest.is_dir():
-                            shutil.rmtree(dest)
-                        else:
-                            dest.unlink()
-                    shutil.move(str(item), str(dest))
-            else:
-                # Move all entries into the target directory
-                for item in entries:
-                    dest = extract_to / item.name
-                    if dest.exists():
-                        if dest.is_dir():
-                            shutil.rmtree(dest)
-                        else:
-                            dest.unlink()
-                    shutil.move(str(item), str(dest))
+            # Map members to their targets once; archives have far fewer unique directories
+            # than files, so each directory is created once and workers never mkdir
+            directories = set()
+            files = []
+            incoming = {}
+            for info in infos:
+                target = _member_path(extract_to, info.filename)
+                if target == extract_to:
+                    continue
+                name = target.relative_to(extract_to).parts[0]
+                incoming[os.path.normcase(name)] = name
+                if info.is_dir():
+                    directories.add(target)
+                else:
+                    directories.add(target.parent)
+                    files.append(info)
+
+            # Split the file members into shards balanced by size and decompress them in
+            # parallel; zlib releases the GIL and ZipFile serializes reads of the shared handle
+            workers = max(1, min(EXTRACT_WORKERS, os.cpu_count() or 1, len(files)))
+            shards = [[] for _ in range(workers)]
+            loads = [0] * workers
+            for info in sorted(files, key=lambda i: i.file_size, reverse=True):
+                idx = loads.index(min(loads))
+                shards[idx].append(info)
+                loads[idx] += info.file_size
+
+            # Existing top-level entries that the archive provides, found with a single scan
+            # of the target, are renamed aside rather than deleted: they are only removed once
+            # the new files are all in place, and are put back if extraction fails. Trash left
+            # by an interrupted run is swept up after a successful install as well
+            trash = []
+            conflicts = []
+            with os.scandir(extract_to) as existing:
+                for entry in existing:
+                    if entry.name.startswith(_TRASH_PREFIX):
+                        trash.append(entry.path)
+                    elif os.path.normcase(entry.name) in incoming:
+                        conflicts.append(entry)
+
+            replaced = []
+            try:
+                for entry in conflicts:
+                    aside = os.path.join(extract_to, f'{_TRASH_PREFIX}{os.getpid()}-{entry.name}')
+                    os.replace(entry.path, aside)
+                    replaced.append((entry.path, aside))
+
+                for directory in sorted(directories, key=lambda d: len(d.parts)):
+                    directory.mkdir(parents=True, exist_ok=True)
+
+                stop = threading.Event()
+                with ThreadPoolExecutor(max_workers=workers) as executor:
+                    pending = [executor.submit(_extract_shard, zip_ref, shard, extract_to, stop) for shard in shards]
+                    try:
+                        # Wake on the first failure from any shard, not in submission order. Poll
+                        # with a timeout: an untimed lock wait can't be interrupted by Ctrl+C on
+                        # Windows before Python 3.14
+                        while pending:
+                            finished, pending = wait(pending, timeout=PROGRESS_INTERVAL,
+                                                     return_when=FIRST_EXCEPTION)
+                            for future in finished:
+                                future.result()
+                    except BaseException:
+                        # A failed member or Ctrl+C: the other workers stop after their current
+                        # member rather than extracting the rest of the archive first
+                        stop.set()
+                        raise
+            except BaseException:
+                # The workers have exited; drop the partial install and restore the old one.
+                # Entries that were never moved aside are still the old install: keep them
+                kept = {os.path.normcase(entry.name) for entry in conflicts[len(replaced):]}
+                written = [name for key, name in incoming.items() if key not in kept]
+                _restore_replaced(extract_to, written, replaced)
+                raise
+
+            trash.extend(aside for _, aside in replaced)
+            if trash:
+                # Deleted in the background so the install finishes without waiting on the
+                # unlinks; not a daemon, so the interpreter completes the cleanup before exiting
+                threading.Thread(target=_remove_trash, args=(trash,)).start()
 
         # Show extraction status inside a frame
         status_lines = [
             "[+] Extracting archive... Done",
-            "[+] Moving files... Done",
             "[+] Extraction completed!"
         ]
         print_frame("EXTRACTING STATUS", status_lines, Colors.GREEN, 'single')
@@ -281,6 +766,47 @@ def extract_zip(zip_path, extract_to):
         return False
 
 
+class _MappedArchive(mmap.mmap):
+    """Read-only memory map usable as a ZipFile source (mmap lacks seekable() before 3.13)"""
+
+    def seekable(self):
+        return True
+
+
+class _ArchiveSpool(tempfile.SpooledTemporaryFile):
+    """Download spool usable as a ZipFile source (SpooledTemporaryFile lacks seekable() before 3.11)"""
+
+    def seekable(self):
+        return True
+
+
+def stream_download_and_extract(url, extract_dir):
+    """Download zip archive into a spooled buffer and extract it into extract_dir.
+
+    Archives up to SPOOL_MAX_SIZE stay in memory; larger ones spill to an anonymous
+    temporary file that is removed automatically, so no archive is left on disk."""
+    with _ArchiveSpool(max_size=SPOOL_MAX_SIZE, dir=extract_dir.parent) as spool:
+        if not download_file(url, spool):
+            return False
+
+        spool.seek(0, os.SEEK_END)
+        if spool.tell() > SPOOL_MAX_SIZE:
+            # The archive spilled to a temporary file: map it so that ZipFile's directory
+            # probing and member reads become memory accesses instead of seek+read calls
+            spool.flush()
+            try:
+                archive = _MappedArchive(spool.fileno(), 0, access=mmap.ACCESS_READ)
+            except (OSError, OverflowError, ValueError):
+                # e.g. larger than the address space on 32-bit builds; read it normally
+                archive = None
+            if archive is not None:
+                with archive:
+                    return extract_zip(archive, extract_dir)
+
+        spool.seek(0)
+        return extract_zip(spool, extract_dir)
+
+
 def uninstall(extract_dir: Path) -> bool:
     """Uninstall Image Tea with safety confirmations"""
     if not extract_dir.exists():
@@ -298,29 +824,14 @@ def uninstall(extract_dir: Path) -> bool:
     ]
     print_frame("UNINSTALL WARNING", warning_lines, Colors.RED, 'double')
     
-    # First confirmation
-    while True:
-        print(f"{Colors.BOLD}Are you sure you want to uninstall? [{Colors.RED}Y{Colors.RESET}/{Colors.GREEN}N{Colors.RESET}]: {Colors.RESET}", end='', flush=True)
-        r1 = getch()
-        print(r1)
-        if r1 in ['n', 'N', '\r', '\n', '']:
-            print_frame("UNINSTALL", ["[+] Uninstall cancelled."], Colors.GREEN, 'single')
-            return False
-        if r1 in ['y', 'Y']:
-            break
-    
-    # Second confirmation
-    while True:
-        print(f"{Colors.BOLD}Final confirmation - Delete Image Tea folder? [{Colors.RED}Y{Colors.RESET}/{Colors.GREEN}N{Colors.RESET}]: {Colors.RESET}", end='', flush=True)
-        r2 = getch()
-        print(r2)
-        if r2 in ['n', 'N', '\r', '\n', '']:
+    # First and final confirmation
+    for prompt in (_PROMPT_UNINSTALL, _PROMPT_UNINSTALL_FINAL):
+        if not _confirm(prompt, default_yes=False):
             print_frame("UNINSTALL", ["[+] Uninstall cancelled."], Colors.GREEN, 'single')
             return False
-        if r2 in ['y', 'Y']:
-            break
     
-    # Perform uninstall
+    # Perform uninstall; shutil.rmtree refuses a symlinked folder and, on POSIX, guards
+    # against symlinks swapped in while it walks a tree the installer didn't write
     try:
         shutil.rmtree(extract_dir)
         print_frame("UNINSTALL", ["[+] Image Tea has been successfully uninstalled."], Colors.GREEN, 'double')
@@ -375,8 +886,7 @@ def run_launcher(extract_dir: Path) -> bool:
 def main():
     """Main setup function with enhanced CLI interface"""
     # Enable ANSI colors on Windows
-    if sys.platform == 'win32':
-        os.system('')
+    enable_ansi_colors()
 
     # Load configuration first so we can show the installer version in the header
     try:
@@ -413,7 +923,7 @@ def main():
         if appimage_path:
             # Running from AppImage - use the directory containing the .AppImage file
             script_dir = Path(appimage_path).parent
-        elif sys.platform == 'darwin' and '.app/Contents/MacOS' in str(sys.executable):
+        elif sys.platform == 'darwin' and '.app/Contents/MacOS' in sys.executable:
             # Running from macOS .app bundle - use the directory containing the .app
             # sys.executable is like: /path/to/Image Tea Installer.app/Contents/MacOS/Image Tea Installer
             # We want: /path/to/
@@ -425,9 +935,8 @@ def main():
             script_dir = Path(sys.executable).parent
     else:
         # Running as normal Python script
-        script_dir = Path(__file__).parent
+        script_dir = _SCRIPT_DIR
     
-    download_path = script_dir / installation_file
     extract_dir = script_dir / "Image-Tea"
     
     # Check if already installed
@@ -445,33 +954,38 @@ def main():
         ]
         print_frame("ALREADY INSTALLED", lines, Colors.GREEN, 'double')
         
-        while True:
-            print(f"{Colors.BOLD}Choose option [{Colors.GREEN}L{Colors.RESET}/{Colors.YELLOW}R{Colors.RESET}/{Colors.RED}U{Colors.RESET}/{Colors.CYAN}X{Colors.RESET}]: {Colors.RESET}", end='', flush=True)
-            choice = getch()
-            print(choice)
+        with _raw_stdin():
+            while True:
+                print(f"{Colors.BOLD}Choose option [{Colors.GREEN}L{Colors.RESET}/{Colors.YELLOW}R{Colors.RESET}/{Colors.RED}U{Colors.RESET}/{Colors.CYAN}X{Colors.RESET}]: {Colors.RESET}", end='', flush=True)
+                choice = getch()
+                # Enter arrives as '\n' in cbreak mode; end the prompt line without echoing it
+                print('' if choice in ('\r', '\n') else choice)
             
-            if choice in ['l', 'L']:
-                launched = run_launcher(extract_dir)
-                if launched:
-                    print_frame("LAUNCH", ["[+] Launched Image Tea."], Colors.GREEN, 'single')
-                else:
-                    print_frame("LAUNCH", ["[!] Launcher not found or failed to start."], Colors.RED, 'single')
-                return
-            elif choice in ['r', 'R']:
-                print_frame("REINSTALL", ["[+] Proceeding with reinstall..."], Colors.YELLOW, 'single')
-                break  # Continue with normal setup process
-            elif choice in ['u', 'U']:
-                if uninstall(extract_dir):
+                if choice in ['l', 'L']:
+                    break  # Launch below, once the terminal is back in its normal mode
+                elif choice in ['r', 'R']:
+                    print_frame("REINSTALL", ["[+] Proceeding with reinstall..."], Colors.YELLOW, 'single')
+                    break  # Continue with normal setup process
+                elif choice in ['u', 'U']:
+                    if uninstall(extract_dir):
+                        return
+                    else:
+                        continue  # Return to options menu
+                elif choice in ['x', 'X', '\r', '\n', '']:
+                    print_frame("EXIT", ["[+] Setup cancelled."], Colors.CYAN, 'single')
                     return
-                else:
-                    continue  # Return to options menu
-            elif choice in ['x', 'X', '\r', '\n', '']:
-                print_frame("EXIT", ["[+] Setup cancelled."], Colors.CYAN, 'single')
-                return
+
+        if choice in ['l', 'L']:
+            launched = run_launcher(extract_dir)
+            if launched:
+                print_frame("LAUNCH", ["[+] Launched Image Tea."], Colors.GREEN, 'single')
+            else:
+                print_frame("LAUNCH", ["[!] Launcher not found or failed to start."], Colors.RED, 'single')
+            return
     
     # Get latest release
     try:
-        release_info = get_latest_release(application_repo)
+        release_info = get_latest_release(application_repo, script_dir / RELEASE_CACHE_FILE)
         lines = [
             f"Version:   {release_info['tag_name']}",
             f"Name:      {release_info['name']}",
@@ -484,21 +998,20 @@ def main():
         return
     
     # Find the installation file in assets
-    download_url = None
-    for asset in release_info['assets']:
-        if asset['name'] == installation_file:
-            download_url = asset['browser_download_url']
-            file_size = asset.get('size', 0)
-            lines.append(f"Size:      {file_size / (1024 * 1024):.2f} MB")
-            break
+    assets = {asset['name']: asset for asset in release_info['assets']}
+    asset = assets.get(installation_file)
+    if asset is not None:
+        file_size = asset.get('size', 0)
+        lines.append(f"Size:      {file_size / (1024 * 1024):.2f} MB")
     
     print_frame("RELEASE INFO", lines, Colors.GREEN, 'double')
     
-    if not download_url:
+    if asset is None:
         lines = [f"[!] Error: {installation_file} not found in latest release assets!"]
         print_frame("ERROR", lines, Colors.RED, 'double')
         input("Press Enter to exit...")
         return
+    download_url = asset['browser_download_url']
     
 # Confirmation prompt (frame contains only the plan; prompt is outside)
     lines = [
@@ -508,17 +1021,7 @@ def main():
     print_frame("SETUP PLAN", lines, Colors.YELLOW, 'double')
 
     # Prompt outside frame, accept Y/N (uppercase shown) — instant keypress
-    while True:
-        print(f"{Colors.BOLD}Proceed with setup? [{Colors.GREEN}Y{Colors.RESET}/{Colors.RED}N{Colors.RESET}]: {Colors.RESET}", end='', flush=True)
-        response = getch()
-        print(response)
-        if response in ['y', 'Y', '\r', '\n', '']:
-            proceed = True
-            break
-        if response in ['n', 'N']:
-            proceed = False
-            break
-        # ignore other keys and loop again
+    proceed = _confirm(_PROMPT_PROCEED)
 
     if not proceed:
         lines = ["Setup cancelled by user."]
@@ -528,27 +1031,11 @@ def main():
     # Create extract directory if it doesn't exist
     extract_dir.mkdir(exist_ok=True)
     
-    # Download the file
-    if not download_file(download_url, download_path):
-        input("Press Enter to exit...")
-        return
-    
-    # Extract the file
-    if not extract_zip(download_path, extract_dir):
+    # Download and extract the file
+    if not stream_download_and_extract(download_url, extract_dir):
         input("Press Enter to exit...")
         return
     
-    # Remove the zip file after successful extraction
-    lines = []
-    try:
-        if download_path.exists():
-            download_path.unlink()
-            lines.append(f"[+] Removed: {download_path.name}")
-    except Exception as e:
-        lines.append(f"[!] Warning: Could not remove archive: {e}")
-    
-    print_frame("CLEANING UP", lines, Colors.YELLOW, 'single')
-    
     # Success message
     lines = [
         "SETUP COMPLETED!",
@@ -558,20 +1045,12 @@ def main():
     print_frame("SUCCESS", lines, Colors.GREEN, 'double')
     
     # Prompt to run application now (outside frame)
-    while True:
-        print(f"{Colors.BOLD}Run Image Tea now? [{Colors.GREEN}Y{Colors.RESET}/{Colors.RED}N{Colors.RESET}]: {Colors.RESET}", end='', flush=True)
-        r = getch()
-        print(r)
-        if r in ['y', 'Y', '\r', '\n', '']:
-            launched = run_launcher(extract_dir)
-            if launched:
-                print_frame("LAUNCH", ["[+] Launched Image Tea."], Colors.GREEN, 'single')
-            else:
-                print_frame("LAUNCH", ["[!] Launcher not found or failed to start."], Colors.RED, 'single')
-            break
-        if r in ['n', 'N']:
-            break
-        # otherwise loop until valid key pressed
+    if _confirm(_PROMPT_RUN_NOW):
+        launched = run_launcher(extract_dir)
+        if launched:
+            print_frame("LAUNCH", ["[+] Launched Image Tea."], Colors.GREEN, 'single')
+        else:
+            print_frame("LAUNCH", ["[!] Launcher not found or failed to start."], Colors.RED, 'single')
 
 
 if __name__ == "__main__":